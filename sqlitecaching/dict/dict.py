@@ -30,54 +30,54 @@ except NameError:
             "sqlite_params provided to CacheDict contained unsupported keys: "
             "[{filtered}]"
         ),
-        params=frozenset(["filtered"]),
+        params=frozenset(("filtered",)),
     )
 
     CacheDictReadOnlyException = __CDC.register_cause(
         cause_name=f"{__name__}.CacheDictReadOnlyException",
         cause_id=1,
         fmt="attempting to perform [{op}] on readonly table [{table}]",
-        params=frozenset(["op", "table"]),
+        params=frozenset(("op", "table")),
     )
     CacheDictKeyTypeException = __CDC.register_cause(
         cause_name=f"{__name__}.CacheDictKeyTypeException",
         cause_id=2,
         fmt="key [{key!r}] has incorrect type [{key_type}] (expected KT: [{KT}])",
-        params=frozenset(["key", "key_type", "KT"]),
-        additional_excepts=frozenset([TypeError]),
+        params=frozenset(("key", "key_type", "KT")),
+        additional_excepts=frozenset((TypeError,)),
     )
     CacheDictNoSuchKeyException = __CDC.register_cause(
         cause_name=f"{__name__}.CacheDictNoSuchKeyException",
         cause_id=3,
         fmt="key [{key!r}] not present in table [{table}]",
-        params=frozenset(["key", "table"]),
-        additional_excepts=frozenset([KeyError]),
+        params=frozenset(("key", "table")),
+        additional_excepts=frozenset((KeyError,)),
     )
     CacheDictValueTypeException = __CDC.register_cause(
         cause_name=f"{__name__}.CacheDictValueTypeException",
         cause_id=4,
         fmt="value [{value!r}] has incorrect type [{value_type}] (expected VT: [{VT}]",
-        params=frozenset(["value", "value_type", "VT"]),
-        additional_excepts=frozenset([TypeError]),
+        params=frozenset(("value", "value_type", "VT")),
+        additional_excepts=frozenset((TypeError,)),
     )
     CacheDictConnectionClosedException = __CDC.register_cause(
         cause_name=f"{__name__}.CacheDictConnectionClosedException",
         cause_id=5,
         fmt="operation [{op}] attempted after database connection closed",
-        params=frozenset(["op"]),
+        params=frozenset(("op",)),
     )
     CacheDictMethodUnsupportedException = __CDC.register_cause(
         cause_name=f"{__name__}.CacheDictMethodUnsupportedException",
         cause_id=6,
         fmt="method [{method}] is unsupported by CacheDict",
-        params=frozenset(["method"]),
+        params=frozenset(("method",)),
     )
     CacheDictPopItemEmptyException = __CDC.register_cause(
         cause_name=f"{__name__}.CacheDictPopItemEmptyException",
         cause_id=7,
         fmt="table [{table}] is empty, cannot popitem()",
-        params=frozenset(["table"]),
-        additional_excepts=frozenset([KeyError]),
+        params=frozenset(("table",)),
+        additional_excepts=frozenset((KeyError,)),
     )
     CacheDictNoneReturnedException = __CDC.register_cause(
         cause_name=f"{__name__}.CacheDictNoneReturnedException",
@@ -86,7 +86,7 @@ except NameError:
             "None value returned inside response from DB? key: [{key!r}] "
             "table: [{table}]"
         ),
-        params=frozenset(["key", "table"]),
+        params=frozenset(("key", "table")),
     )
     CacheDictUpdateKwargsException = __CDC.register_cause(
         cause_name=f"{__name__}.CacheDictUpdateKwargsException",
@@ -95,7 +95,7 @@ except NameError:
             "**kwargs passed into update() will never reliably work as KT [{KT}] "
             "!= [{ktype}]"
         ),
-        params=frozenset(["KT", "ktype"]),
+        params=frozenset(("KT", "ktype")),
     )
 
 
@@ -613,7 +613,8 @@ class CacheDict(typing.Dict[KT, VT]):
         *,
         op: str,
     ) -> sqlite3.Cursor:
-        log.debug("_execute [%r] for [%r]", statement, ReprWrapper(self))
+        if log.isEnabledFor(logging.DEBUG):
+            log.debug("_execute [%r] for [%r]", statement, ReprWrapper(self))
         if not self.conn:
             log.warning("_execute() with None connection [%r]", self)
             raise CacheDictConnectionClosedException({"op": op})
@@ -658,7 +659,8 @@ class CacheDict(typing.Dict[KT, VT]):
         return 0
 
     def __bool__(self: "CacheDict[KT, VT]") -> bool:
-        log.debug("bool [%r]", ReprWrapper(self))
+        if log.isEnabledFor(logging.DEBUG):
+            log.debug("bool [%r]", ReprWrapper(self))
         if not self.initialized:
             log.warning("preinitial, return false")
             return False
@@ -671,7 +673,8 @@ class CacheDict(typing.Dict[KT, VT]):
         return False
 
     def __delitem__(self: "CacheDict[KT, VT]", key: KT, /) -> None:
-        log.debug("delete [%r] key: [%r]", ReprWrapper(self), key)
+        if log.isEnabledFor(logging.DEBUG):
+            log.debug("delete [%r] key: [%r]", ReprWrapper(self), key)
         if self.read_only:
             raise CacheDictReadOnlyException(
                 {
@@ -702,7 +705,8 @@ class CacheDict(typing.Dict[KT, VT]):
             self._execute(remove_stmt, dataclasses.astuple(key), op="remove")
 
     def __contains__(self: "CacheDict[KT, VT]", key: object, /) -> bool:
-        log.debug("get [%r] key: [%r]", ReprWrapper(self), key)
+        if log.isEnabledFor(logging.DEBUG):
+            log.debug("get [%r] key: [%r]", ReprWrapper(self), key)
         if not isinstance(key, self.mapping.KeyType):
             raise CacheDictKeyTypeException(
                 {
@@ -721,7 +725,8 @@ class CacheDict(typing.Dict[KT, VT]):
         return False
 
     def __getitem__(self: "CacheDict[KT, VT]", key: KT, /) -> VT:
-        log.debug("get [%r] key: [%r]", ReprWrapper(self), key)
+        if log.isEnabledFor(logging.DEBUG):
+            log.debug("get [%r] key: [%r]", ReprWrapper(self), key)
         if not isinstance(key, self.mapping.KeyType):
             raise CacheDictKeyTypeException(
                 {
@@ -759,7 +764,8 @@ class CacheDict(typing.Dict[KT, VT]):
                     key = None
 
     def __setitem__(self: "CacheDict[KT, VT]", key: KT, value: VT, /) -> None:
-        log.debug("set [%r] key: [%r] value: [%r]", ReprWrapper(self), key, value)
+        if log.isEnabledFor(logging.DEBUG):
+            log.debug("set [%r] key: [%r] value: [%r]", ReprWrapper(self), key, value)
         if self.read_only:
             raise CacheDictReadOnlyException(
                 {
@@ -863,7 +869,7 @@ class CacheDict(typing.Dict[KT, VT]):
         if not sqlite_params:
             return {}
 
-        filtered_params: typing.FrozenSet[str] = frozenset([])
+        filtered_params: typing.Set[str] = set()
         cleaned_params = {}
         for (param, value) in sqlite_params.items():
             if param in cls.PASSTHROUGH_PARAMS:
@@ -880,10 +886,12 @@ class CacheDict(typing.Dict[KT, VT]):
                     param,
                     value,
                 )
-                filtered_params = filtered_params | frozenset([param])
+                filtered_params.add(param)
         if cls.raise_on_filtered_sqlite_params():
             log.info("raising for filtered sqlite params")
-            raise CacheDictFilteredSqliteParamsException({"filtered": filtered_params})
+            raise CacheDictFilteredSqliteParamsException(
+                {"filtered": frozenset(filtered_params)},
+            )
         return cleaned_params
 
     @classmethod
@@ -1,7 +1,8 @@
 import dataclasses
+import functools
 import logging
-import re
 import sqlite3
+import sys
 import typing
 
 from sqlitecaching.exceptions import SqliteCachingException
@@ -23,19 +24,19 @@ except NameError:
         cause_name=f"{__name__}.MappingMissingKeys",
         cause_id=0,
         fmt="Mapping must have keys, provided: [{no_keys}]",
-        params=frozenset(["no_keys"]),
+        params=frozenset(("no_keys",)),
     )
     CacheDictMappingReservedTableException = __CDMC.register_cause(
         cause_name=f"{__name__}.ReservedTableException",
         cause_id=1,
         fmt="table cannot start with sqlite_ : [{table_name}]",
-        params=frozenset(["table_name"]),
+        params=frozenset(("table_name",)),
     )
     CacheDictMappingInvalidIdentifierException = __CDMC.register_cause(
         cause_name=f"{__name__}.InvalidIdentifierException",
         cause_id=2,
         fmt="identifier provided: [{identifier}] does not match requirements [{re}]",
-        params=frozenset(["identifier", "re"]),
+        params=frozenset(("identifier", "re")),
     )
     CacheDictMappingKeyValOverlapException = __CDMC.register_cause(
         cause_name=f"{__name__}.KeyValColumnOverlapException",
@@ -44,13 +45,13 @@ except NameError:
             "the sets of key columns and value columns must be disjoint. columns "
             "[{columns}] occur in both key and value sets"
         ),
-        params=frozenset(["columns"]),
+        params=frozenset(("columns",)),
     )
     CacheDictMappingNoIdentifierProvidedException = __CDMC.register_cause(
         cause_name=f"{__name__}.NoIdentifierProvidedException",
         cause_id=4,
         fmt="The identifier provided: [{identifier}] does not have a value.",
-        params=frozenset(["identifier"]),
+        params=frozenset(("identifier",)),
     )
     CacheDictMappingInvalidSQLParamTypeException = __CDMC.register_cause(
         cause_name=f"{__name__}.InvalidSQLParamTypeException",
@@ -59,25 +60,25 @@ except NameError:
             "SQL parameter type value was provided as a truthy value of type "
             "[{type}]. Parameter types must be strings."
         ),
-        params=frozenset(["type"]),
+        params=frozenset(("type",)),
     )
     CacheDictMappingInvalidSQLTypeException = __CDMC.register_cause(
         cause_name=f"{__name__}.InvalidSQLTypeException",
         cause_id=6,
         fmt="sqltype provided: [{sqltype}] does not match requirements [{re}]",
-        params=frozenset(["sqltype", "re"]),
+        params=frozenset(("sqltype", "re")),
     )
     CacheDictMappingKeyTypeNotDataclassException = __CDMC.register_cause(
         cause_name=f"{__name__}.KeyTypeNotDataclassException",
         cause_id=7,
         fmt="Key type provided [{type}] is not a dataclass",
-        params=frozenset(["type"]),
+        params=frozenset(("type",)),
     )
     CacheDictMappingValueTypeNotDataclassException = __CDMC.register_cause(
         cause_name=f"{__name__}.ValueTypeNotDataclassException",
         cause_id=8,
         fmt="Value type provided [{type}] is not a dataclass",
-        params=frozenset(["type"]),
+        params=frozenset(("type",)),
     )
     CacheDictMappingIncorrectKeyTypesTypeException = __CDMC.register_cause(
         cause_name=f"{__name__}.IncorrectKeyTypesTypeException",
@@ -86,7 +87,7 @@ except NameError:
             "The type of the key_types parameter provided: [{key_types}] is not "
             "an instance of the key_type parameter [{key_type}]"
         ),
-        params=frozenset(["key_types", "key_type"]),
+        params=frozenset(("key_types", "key_type")),
     )
     CacheDictMappingIncorrectValueTypesTypeException = __CDMC.register_cause(
         cause_name=f"{__name__}.IncorrectValueTypesTypeException",
@@ -95,7 +96,7 @@ except NameError:
             "The type of the value_types parameter provided: [{value_types}] is "
             "not an instance of the value_type parameter [{value_type}]"
         ),
-        params=frozenset(["value_types", "value_type"]),
+        params=frozenset(("value_types", "value_type")),
     )
 
 Ident = typing.NewType("Ident", str)
@@ -110,15 +111,14 @@ SqlStatement = typing.NewType("SqlStatement", str)
 
 ColMapping = typing.Mapping[ValidIdent, ValidSqlType]
 
-
-class IdentClash(typing.NamedTuple):
-    original: Ident
-    clashes: typing.FrozenSet[Ident]
-
-
-class ColInfo(typing.NamedTuple):
-    original: Ident
-    sqltype: ValidSqlType
+# separators used when joining column lists in the generated statements
+_KEY_SEP = ", -- key\n    "
+_VALUE_SEP = ", -- value\n    "
+_PRIMARY_KEY_SEP = ", -- primary key\n    "
+_PLACEHOLDER_SEP = ",\n    "
+_PRIMARY_KEY_COLUMN_SEP = ",\n        "
+# and the single separator used everywhere in compact statements
+_COMPACT_SEP = ", "
 
 
 KT = typing.TypeVar("KT")
@@ -126,6 +126,41 @@ VT = typing.TypeVar("VT")
 
 
 class CacheDictMapping(typing.Generic[KT, VT]):
+    __slots__ = (
+        "table_ident",
+        "key_idents",
+        "value_idents",
+        "key_columns",
+        "value_columns",
+        "KeyType",
+        "ValueType",
+        "pretty",
+        "_sorted_key_idents",
+        "_sorted_value_idents",
+        "_key_column_list",
+        "_value_column_list",
+        "_all_column_list",
+        "_key_placeholders",
+        "_all_placeholders",
+        "_create_statement",
+        "_clear_statement",
+        "_delete_statement",
+        "_upsert_statement",
+        "_select_statement",
+        "_tceles_statement",
+        "_remove_statement",
+        "_length_statement",
+        "_keys_statement",
+        "_syek_statement",
+        "_items_statement",
+        "_smeti_statement",
+        "_values_statement",
+        "_seulav_statement",
+        "_bool_statement",
+    )
+
+    _EMPTY_SQLTYPE: typing.ClassVar[ValidSqlType] = ValidSqlType("")
+
     COUNT_COLUMN: typing.ClassVar[str] = "COUNT(*)"
     TIMESTAMP_COLUMN: typing.ClassVar[str] = "__timestamp"
 
@@ -138,21 +173,33 @@ class CacheDictMapping(typing.Generic[KT, VT]):
     KeyType: typing.Type[KT]
     ValueType: typing.Type[VT]
 
-    _create_statement: typing.Optional[SqlStatement] = None
-    _clear_statement: typing.Optional[SqlStatement] = None
-    _delete_statement: typing.Optional[SqlStatement] = None
-    _upsert_statement: typing.Optional[SqlStatement] = None
-    _select_statement: typing.Optional[SqlStatement] = None
-    _tceles_statement: typing.Optional[SqlStatement] = None
-    _remove_statement: typing.Optional[SqlStatement] = None
-    _length_statement: typing.Optional[SqlStatement] = None
-    _keys_statement: typing.Optional[SqlStatement] = None
-    _syek_statement: typing.Optional[SqlStatement] = None
-    _items_statement: typing.Optional[SqlStatement] = None
-    _smeti_statement: typing.Optional[SqlStatement] = None
-    _values_statement: typing.Optional[SqlStatement] = None
-    _seulav_statement: typing.Optional[SqlStatement] = None
-    _bool_statement: typing.Optional[SqlStatement] = None
+    pretty: bool
+
+    _sorted_key_idents: typing.Tuple[ValidIdent, ...]
+    _sorted_value_idents: typing.Tuple[ValidIdent, ...]
+
+    _key_column_list: str
+    _value_column_list: str
+    _all_column_list: str
+
+    _key_placeholders: str
+    _all_placeholders: str
+
+    _create_statement: SqlStatement
+    _clear_statement: SqlStatement
+    _delete_statement: SqlStatement
+    _upsert_statement: SqlStatement
+    _select_statement: SqlStatement
+    _tceles_statement: SqlStatement
+    _remove_statement: SqlStatement
+    _length_statement: SqlStatement
+    _keys_statement: SqlStatement
+    _syek_statement: SqlStatement
+    _items_statement: SqlStatement
+    _smeti_statement: SqlStatement
+    _values_statement: SqlStatement
+    _seulav_statement: SqlStatement
+    _bool_statement: SqlStatement
 
     def __init__(
         self,
@@ -162,6 +209,7 @@ class CacheDictMapping(typing.Generic[KT, VT]):
         value_type: typing.Type[VT],
         key_types: typing.Optional[KT] = None,
         value_types: typing.Optional[VT] = None,
+        pretty: bool = False,
     ):
         self.table_ident = self._validate_ident(Ident(table))
         if self.table_ident.startswith('"sqlite_'):
@@ -172,35 +220,69 @@ class CacheDictMapping(typing.Generic[KT, VT]):
         if not dataclasses.is_dataclass(value_type):
             raise CacheDictMappingValueTypeNotDataclassException({"type": value_type})
 
-        self.key_idents = self._validate_idents(dataclasses.fields(key_type))
-        self.value_idents = self._validate_idents(dataclasses.fields(value_type))
-
-        if not self.key_idents:
-            raise CacheDictMappingMissingKeysException({"no_keys": self.key_idents})
-
-        overlap_idents = self.key_idents & self.value_idents
-        if overlap_idents:
-            raise CacheDictMappingKeyValOverlapException({"columns": overlap_idents})
+        (self.key_idents, self.value_idents) = _resolve_schema(
+            key_type,
+            value_type,
+        )
 
         self.KeyType = key_type
         self.ValueType = value_type
+        self.pretty = pretty
 
         if key_types:
             if not isinstance(key_types, key_type):
                 raise CacheDictMappingIncorrectKeyTypesTypeException(
                     {"key_types": type(key_types), "key_type": key_type},
                 )
-            self.key_columns = self._column_info(dataclasses.asdict(key_types))
+            self.key_columns = self._column_info(self._shallow_asdict(key_types))
         else:
-            self.key_columns = {c: ValidSqlType("") for c in self.key_idents}
+            self.key_columns = dict.fromkeys(self.key_idents, self._EMPTY_SQLTYPE)
         if value_types:
             if not isinstance(value_types, value_type):
                 raise CacheDictMappingIncorrectValueTypesTypeException(
                     {"value_types": type(value_types), "value_type": value_type},
                 )
-            self.value_columns = self._column_info(dataclasses.asdict(value_types))
+            self.value_columns = self._column_info(self._shallow_asdict(value_types))
+        else:
+            self.value_columns = dict.fromkeys(self.value_idents, self._EMPTY_SQLTYPE)
+
+        # statements list columns in sorted order, sort once for all of them
+        self._sorted_key_idents = tuple(sorted(self.key_idents))
+        self._sorted_value_idents = tuple(sorted(self.value_idents))
+
+        # column lists and placeholders shared by several statements, laid
+        # out (and commented) to suit the statements they are used in
+        key_count = len(self.key_idents)
+        all_count = key_count + len(self.value_idents)
+        if self.pretty:
+            joined_keys = _KEY_SEP.join(self._sorted_key_idents)
+            self._key_column_list = f"{joined_keys} -- key"
+            if self._sorted_value_idents:
+                joined_values = _VALUE_SEP.join(self._sorted_value_idents)
+                self._value_column_list = f"{joined_values} -- value"
+                self._all_column_list = (
+                    f"{joined_keys}{_KEY_SEP}{self._value_column_list}"
+                )
+            else:
+                self._value_column_list = ""
+                self._all_column_list = self._key_column_list
+
+            self._key_placeholders = _PLACEHOLDER_SEP.join(["?"] * key_count)
+            self._all_placeholders = _PLACEHOLDER_SEP.join(["?"] * all_count)
         else:
-            self.value_columns = {c: ValidSqlType("") for c in self.value_idents}
+            self._key_column_list = _COMPACT_SEP.join(self._sorted_key_idents)
+            self._value_column_list = _COMPACT_SEP.join(self._sorted_value_idents)
+            self._all_column_list = _COMPACT_SEP.join(
+                self._sorted_key_idents + self._sorted_value_idents,
+            )
+
+            self._key_placeholders = _COMPACT_SEP.join(["?"] * key_count)
+            self._all_placeholders = _COMPACT_SEP.join(["?"] * all_count)
+
+        # the mapping is immutable once constructed, so render every
+        # statement now and leave the accessors as plain slot reads.
+        for (name, (builder_name, builder_kwargs)) in self._STATEMENT_BUILDERS.items():
+            setattr(self, name, getattr(self, builder_name)(**builder_kwargs))
 
     def __repr__(self: "CacheDictMapping[KT, VT]") -> str:
         return (
@@ -214,21 +296,59 @@ class CacheDictMapping(typing.Generic[KT, VT]):
             values=self.value_columns,
         )
 
+    @classmethod
+    def cached(
+        cls,
+        *,
+        table: IdentIn,
+        key_type: typing.Type[KT],
+        value_type: typing.Type[VT],
+        key_types: typing.Optional[KT] = None,
+        value_types: typing.Optional[VT] = None,
+        pretty: bool = False,
+    ) -> "CacheDictMapping[KT, VT]":
+        # mappings are immutable, so an equal mapping constructed earlier can
+        # be handed out again rather than validated and rendered from scratch.
+        # The returned instance is shared by every caller, in any thread,
+        # passing equal arguments. key_types and value_types are only cached
+        # when hashable (e.g. frozen dataclasses), otherwise a new mapping is
+        # constructed on every call.
+        try:
+            hash((table, key_types, value_types))
+        except TypeError:
+            return cls(
+                table=table,
+                key_type=key_type,
+                value_type=value_type,
+                key_types=key_types,
+                value_types=value_types,
+                pretty=pretty,
+            )
+        return _cached_mapping(
+            (cls, table, key_type, value_type, key_types, value_types, pretty),
+        )
+
+    @staticmethod
+    def _shallow_asdict(instance: typing.Any, /) -> typing.Dict[str, typing.Any]:
+        # the sqltypes are plain strings, dataclasses.asdict() would deep copy
+        return {f.name: getattr(instance, f.name) for f in dataclasses.fields(instance)}
+
     @classmethod
     def _column_info(cls, types: typing.Mapping[str, SqlTypeIn], /) -> ColMapping:
-        columns: typing.Dict[ValidIdent, ValidSqlType] = {}
-        for (c, t) in types.items():
-            c = cls._validate_ident(Ident(c))
-            if t:
-                if not isinstance(t, str):
-                    raise CacheDictMappingInvalidSQLParamTypeException(
-                        {"type": type(t)},
-                    )
-                c_sqltype = cls._validate_sqltype(SqlType(t))
-            else:
-                c_sqltype = ValidSqlType("")
-            columns[c] = c_sqltype
-        return columns
+        return {
+            cls._validate_ident(Ident(c)): cls._column_sqltype(t)
+            for (c, t) in types.items()
+        }
+
+    @classmethod
+    def _column_sqltype(cls, sqltype: SqlTypeIn, /) -> ValidSqlType:
+        if not sqltype:
+            return cls._EMPTY_SQLTYPE
+        if not isinstance(sqltype, str):
+            raise CacheDictMappingInvalidSQLParamTypeException(
+                {"type": type(sqltype)},
+            )
+        return cls._validate_sqltype(SqlType(sqltype))
 
     @classmethod
     def _validate_idents(
@@ -236,13 +356,9 @@ class CacheDictMapping(typing.Generic[KT, VT]):
         fields: typing.Iterable[dataclasses.Field],
         /,
     ) -> typing.FrozenSet[ValidIdent]:
-        field_names = [f.name for f in fields]
-        valid_idents: typing.FrozenSet[ValidIdent] = frozenset([])
-        for field in field_names:
-            ident = Ident(field)
-            valid_ident = cls._validate_ident(ident)
-            valid_idents |= {valid_ident}
-        return valid_idents
+        # _validate_ident is a single translate() pass and cached per name,
+        # so validating each field in turn is cheaper than a combined regex.
+        return frozenset([cls._validate_ident(Ident(f.name)) for f in fields])
 
     # fmt: off
     _IDENTIFIER_RE_DEFN: typing.ClassVar[str] = (
@@ -253,25 +369,39 @@ class CacheDictMapping(typing.Generic[KT, VT]):
     )
     # fmt: on
 
-    _IDENTIFIER_PATTERN: typing.ClassVar[typing.Pattern[str]] = re.compile(
-        _IDENTIFIER_RE_DEFN,
-        flags=(re.ASCII | re.VERBOSE),
+    # deletes every character allowed in an identifier, so a valid identifier
+    # translates to the empty string. Together with the length and first
+    # character checks this implements _IDENTIFIER_RE_DEFN, which is kept to
+    # describe the requirements in the error message.
+    _IDENTIFIER_DELETE_TABLE: typing.ClassVar[
+        typing.Dict[int, typing.Optional[int]]
+    ] = str.maketrans(
+        "",
+        "",
+        "abcdefghijklmnopqrstuvwxyz0123456789_",
     )
 
+    # column names repeat across mappings, so remember the valid ones. Invalid
+    # identifiers raise and are never cached.
     @classmethod
+    @functools.lru_cache(maxsize=1024)
     def _validate_ident(cls, ident: Ident, /) -> ValidIdent:
         if not ident:
             raise CacheDictMappingNoIdentifierProvidedException(
                 {"identifier": ident},
             )
 
-        match = cls._IDENTIFIER_PATTERN.match(ident)
-        if not match:
+        if (
+            len(ident) > 63
+            or not ("a" <= ident[0] <= "z")
+            or ident.translate(cls._IDENTIFIER_DELETE_TABLE)
+        ):
             raise CacheDictMappingInvalidIdentifierException(
                 {"identifier": ident, "re": cls._IDENTIFIER_RE_DEFN},
             )
 
-        return ValidIdent(f'"{ident}"')
+        # interned so mappings sharing column names share the strings
+        return ValidIdent(sys.intern(f'"{ident}"'))
 
     # fmt: off
     _SQLTYPE_RE_DEFN: typing.ClassVar[str] = (
@@ -282,20 +412,48 @@ class CacheDictMapping(typing.Generic[KT, VT]):
     )
     # fmt: on
 
-    _SQLTYPE_PATTERN: typing.ClassVar[typing.Pattern[str]] = re.compile(
-        _SQLTYPE_RE_DEFN,
-        flags=(re.ASCII | re.VERBOSE),
+    # snapshot of the registered converter names, refreshed whenever a sqltype
+    # is not found in case a converter has been registered since.
+    _known_sqltypes: typing.ClassVar[typing.FrozenSet[str]] = frozenset(
+        sqlite3.converters,
+    )
+
+    # as _IDENTIFIER_DELETE_TABLE, for the uppercase sqltype alphabet
+    _SQLTYPE_DELETE_TABLE: typing.ClassVar[
+        typing.Dict[int, typing.Optional[int]]
+    ] = str.maketrans(
+        "",
+        "",
+        "ABCDEFGHIJKLMNOPQRSTUVWXYZ0123456789_",
     )
 
     @classmethod
-    def _validate_sqltype(cls, sqltype: SqlType, /) -> ValidSqlType:
-        match = cls._SQLTYPE_PATTERN.match(sqltype)
-        if not match:
+    @functools.lru_cache(maxsize=256)
+    def _check_sqltype(cls, sqltype: SqlType, /) -> ValidSqlType:
+        if (
+            not sqltype
+            or len(sqltype) > 63
+            or not ("A" <= sqltype[0] <= "Z")
+            or sqltype.translate(cls._SQLTYPE_DELETE_TABLE)
+        ):
             raise CacheDictMappingInvalidSQLTypeException(
                 {"sqltype": sqltype, "re": cls._SQLTYPE_RE_DEFN},
             )
+        return ValidSqlType(sys.intern(str(sqltype)))
+
+    @classmethod
+    def _validate_sqltype(cls, sqltype: SqlType, /) -> ValidSqlType:
+        # only the format check is cached, converters can be registered at any
+        # time so the warning below is evaluated on every call.
+        valid_sqltype = cls._check_sqltype(sqltype)
 
-        if sqltype not in sqlite3.converters:
+        # the converter lookup only feeds the warning, skip it if not logged
+        if not log.isEnabledFor(logging.WARNING):
+            return valid_sqltype
+
+        if sqltype not in cls._known_sqltypes:
+            cls._known_sqltypes = frozenset(sqlite3.converters)
+        if sqltype not in cls._known_sqltypes:
             log.warning(
                 (
                     "sqltype [%s] is not currently present in sqlite3.converters. "
@@ -303,39 +461,67 @@ class CacheDictMapping(typing.Generic[KT, VT]):
                 ),
                 sqltype,
             )
-        return ValidSqlType(sqltype)
+        return valid_sqltype
 
     # fmt: off
-    _CREATE_FMT: typing.ClassVar[str] = (
-        "-- sqlitecaching create table\n"
-        "CREATE TABLE IF NOT EXISTS {table_identifier}\n"
-        "(\n"
-        "    -- timestamp (for ordering)\n"
-        "    {timestamp_column} TIMESTAMP,\n"
-        "    -- keys\n"
-        "    {key_column_definitions}\n"
-        "    -- values\n"
-        "    {value_column_definitions}\n"
-        "    {primary_key_definition}\n"
-        ");\n"
-    )
-    _PRIMARY_KEY_FMT: typing.ClassVar[str] = (
-        "PRIMARY KEY (\n"
-        "        {primary_key_columns}\n"
-        "    ) ON CONFLICT ABORT"
-    )
+    @staticmethod
+    def _create_fmt(
+        *,
+        table_identifier: str,
+        timestamp_column: str,
+        key_column_definitions: str,
+        value_column_definitions: str,
+        primary_key_definition: str,
+    ) -> str:
+        return (
+            "-- sqlitecaching create table\n"
+            f"CREATE TABLE IF NOT EXISTS {table_identifier}\n"
+            "(\n"
+            "    -- timestamp (for ordering)\n"
+            f"    {timestamp_column} TIMESTAMP,\n"
+            "    -- keys\n"
+            f"    {key_column_definitions}\n"
+            "    -- values\n"
+            f"    {value_column_definitions}\n"
+            f"    {primary_key_definition}\n"
+            ");\n"
+        )
+
+    @staticmethod
+    def _primary_key_fmt(*, primary_key_columns: str) -> str:
+        return (
+            "PRIMARY KEY (\n"
+            f"        {primary_key_columns}\n"
+            "    ) ON CONFLICT ABORT"
+        )
     # fmt: on
 
     def create_statement(self) -> SqlStatement:
-        if self._create_statement:
-            return self._create_statement
+        return self._create_statement
 
-        key_columns = sorted(self.key_idents)
+    def _build_create_statement(self) -> SqlStatement:
+        key_columns = self._sorted_key_idents
 
-        value_columns = sorted(self.value_idents)
+        value_columns = self._sorted_value_idents
+
+        if not self.pretty:
+            column_definitions = [f"{self.TIMESTAMP_COLUMN} TIMESTAMP"]
+            for (columns, sqltypes) in (
+                (key_columns, self.key_columns),
+                (value_columns, self.value_columns),
+            ):
+                column_definitions.extend(
+                    f"{c} {sqltypes[c]}" if sqltypes[c] else c for c in columns
+                )
+            joined_definitions = _COMPACT_SEP.join(column_definitions)
+            return SqlStatement(
+                f"CREATE TABLE IF NOT EXISTS {self.table_ident} "
+                f"({joined_definitions}, "
+                f"PRIMARY KEY ({self._key_column_list}) ON CONFLICT ABORT);",
+            )
 
         # fmt: off
-        key_column_definitions = ", -- primary key\n    ".join(
+        key_column_definitions = _PRIMARY_KEY_SEP.join(
             [
                 f"{column} {self.key_columns[column]}"
                 for column in key_columns
@@ -344,7 +530,7 @@ class CacheDictMapping(typing.Generic[KT, VT]):
         key_column_definitions += ", -- primary key"
 
         if value_columns:
-            value_column_definitions = ", -- value\n    ".join(
+            value_column_definitions = _VALUE_SEP.join(
                 [
                     f"{column} {self.value_columns[column]}"
                     for column in value_columns
@@ -355,462 +541,533 @@ class CacheDictMapping(typing.Generic[KT, VT]):
             value_column_definitions = "-- no values defined"
         # fmt: on
 
-        primary_key_columns = ",\n        ".join(key_columns)
-        primary_key_definition = self._PRIMARY_KEY_FMT.format(
+        primary_key_columns = _PRIMARY_KEY_COLUMN_SEP.join(key_columns)
+        primary_key_definition = self._primary_key_fmt(
             primary_key_columns=primary_key_columns,
         )
 
-        unstripped_create_statement = self._CREATE_FMT.format(
-            table_identifier=self.table_ident,
-            timestamp_column=self.TIMESTAMP_COLUMN,
-            key_column_definitions=key_column_definitions,
-            value_column_definitions=value_column_definitions,
-            primary_key_definition=primary_key_definition,
+        create_statement = SqlStatement(
+            self._create_fmt(
+                table_identifier=self.table_ident,
+                timestamp_column=self.TIMESTAMP_COLUMN,
+                key_column_definitions=key_column_definitions,
+                value_column_definitions=value_column_definitions,
+                primary_key_definition=primary_key_definition,
+            ),
         )
-
-        create_lines = []
-        for line in unstripped_create_statement.splitlines():
-            create_lines.append(line.rstrip())
-        # needed for trailing newline
-        create_lines.append("")
-        create_statement = SqlStatement("\n".join(create_lines))
-        self._create_statement = create_statement
         return create_statement
 
     # fmt: off
-    _CLEAR_FMT: typing.ClassVar[str] = (
-        "-- sqlitecaching clear table\n"
-        "DELETE from {table_identifier};\n"
-    )
+    @staticmethod
+    def _clear_fmt(*, table_identifier: str) -> str:
+        return (
+            "-- sqlitecaching clear table\n"
+            f"DELETE from {table_identifier};\n"
+        )
     # fmt: on
 
     def clear_statement(self) -> SqlStatement:
-        if self._clear_statement:
-            return self._clear_statement
+        return self._clear_statement
 
-        unstripped_clear_statement = self._CLEAR_FMT.format(
-            table_identifier=self.table_ident,
-        )
+    def _build_clear_statement(self) -> SqlStatement:
+        if not self.pretty:
+            return SqlStatement(f"DELETE from {self.table_ident};")
 
-        clear_lines = []
-        for line in unstripped_clear_statement.splitlines():
-            clear_lines.append(line.rstrip())
-        # needed for trailing newline
-        clear_lines.append("")
-        clear_statement = SqlStatement("\n".join(clear_lines))
-        self._clear_statement = clear_statement
+        clear_statement = SqlStatement(
+            self._clear_fmt(
+                table_identifier=self.table_ident,
+            ),
+        )
         return clear_statement
 
     # fmt: off
-    _DELETE_FMT: typing.ClassVar[str] = (
-        "-- sqlitecaching delete table\n"
-        "DROP TABLE {table_identifier};\n"
-    )
+    @staticmethod
+    def _delete_fmt(*, table_identifier: str) -> str:
+        return (
+            "-- sqlitecaching delete table\n"
+            f"DROP TABLE {table_identifier};\n"
+        )
     # fmt: on
 
     def delete_statement(self) -> SqlStatement:
-        if self._delete_statement:
-            return self._delete_statement
+        return self._delete_statement
 
-        unstripped_delete_statement = self._DELETE_FMT.format(
-            table_identifier=self.table_ident,
-        )
+    def _build_delete_statement(self) -> SqlStatement:
+        if not self.pretty:
+            return SqlStatement(f"DROP TABLE {self.table_ident};")
 
-        delete_lines = []
-        for line in unstripped_delete_statement.splitlines():
-            delete_lines.append(line.rstrip())
-        # needed for trailing newline
-        delete_lines.append("")
-        delete_statement = SqlStatement("\n".join(delete_lines))
-        self._delete_statement = delete_statement
+        delete_statement = SqlStatement(
+            self._delete_fmt(
+                table_identifier=self.table_ident,
+            ),
+        )
         return delete_statement
 
     # fmt: off
-    _UPSERT_FMT: typing.ClassVar[str] = (
-        "-- sqlitecaching insert or update into table\n"
-        "INSERT INTO {table_identifier}\n"
-        "(\n"
-        "    -- timestamp\n"
-        "    {timestamp_column},\n"
-        "    -- all columns\n"
-        "    {all_columns}\n"
-        ") VALUES (\n"
-        "    -- timestamp\n"
-        "    ?,\n"
-        "    -- all values\n"
-        "    {all_values}\n"
-        ") ON CONFLICT {upsert_stmt}\n"
-        ";\n"
-    )
-    _UPSERT_WITH_VALUES_STMT_FMT: typing.ClassVar[str] = (
-        "(\n"
-        "    -- key columns\n"
-        "    {key_columns}\n"
-        ") DO UPDATE SET (\n"
-        "    -- value columns\n"
-        "    {value_columns}\n"
-        ") = (\n"
-        "    -- value values\n"
-        "    {value_values}\n"
-        ")"
-    )
+    @staticmethod
+    def _upsert_fmt(
+        *,
+        table_identifier: str,
+        timestamp_column: str,
+        all_columns: str,
+        all_values: str,
+        upsert_stmt: str,
+    ) -> str:
+        return (
+            "-- sqlitecaching insert or update into table\n"
+            f"INSERT INTO {table_identifier}\n"
+            "(\n"
+            "    -- timestamp\n"
+            f"    {timestamp_column},\n"
+            "    -- all columns\n"
+            f"    {all_columns}\n"
+            ") VALUES (\n"
+            "    -- timestamp\n"
+            "    ?,\n"
+            "    -- all values\n"
+            f"    {all_values}\n"
+            f") ON CONFLICT {upsert_stmt}\n"
+            ";\n"
+        )
+
+    @staticmethod
+    def _upsert_with_values_stmt_fmt(
+        *,
+        key_columns: str,
+        value_columns: str,
+        value_values: str,
+    ) -> str:
+        return (
+            "(\n"
+            "    -- key columns\n"
+            f"    {key_columns}\n"
+            ") DO UPDATE SET (\n"
+            "    -- value columns\n"
+            f"    {value_columns}\n"
+            ") = (\n"
+            "    -- value values\n"
+            f"    {value_values}\n"
+            ")"
+        )
     _UPSERT_WITHOUT_VALUES_STMT: typing.ClassVar[str] = (
         "DO NOTHING"
     )
     # fmt: on
 
     def upsert_statement(self) -> SqlStatement:
-        if self._upsert_statement:
-            return self._upsert_statement
+        return self._upsert_statement
 
-        key_column_names = sorted(self.key_idents)
+    def _build_upsert_statement(self) -> SqlStatement:
+        key_columns = self._key_column_list
 
-        value_column_names = sorted(self.value_idents)
+        value_column_names = self._sorted_value_idents
 
-        key_columns = ", -- key\n    ".join(key_column_names)
-        all_columns = key_columns
-        key_columns += " -- key"
+        if not self.pretty:
+            if value_column_names:
+                value_values = _COMPACT_SEP.join(
+                    [f"excluded.{c}" for c in value_column_names],
+                )
+                upsert_stmt = (
+                    f"({key_columns}) DO UPDATE SET "
+                    f"({self._value_column_list}) = ({value_values})"
+                )
+            else:
+                upsert_stmt = self._UPSERT_WITHOUT_VALUES_STMT
+            return SqlStatement(
+                f"INSERT INTO {self.table_ident} "
+                f"({self.TIMESTAMP_COLUMN}, {self._all_column_list}) "
+                f"VALUES (?, {self._all_placeholders}) ON CONFLICT {upsert_stmt};",
+            )
 
         if value_column_names:
-            all_columns += ", -- key\n    "
-            value_columns = ", -- value\n    ".join(value_column_names)
-            value_columns += " -- value"
-            all_columns += value_columns
+            all_columns = self._all_column_list
 
-            value_values = ", -- value\n    ".join(
+            joined_value_values = _VALUE_SEP.join(
                 [f"excluded.{c}" for c in value_column_names],
             )
-            value_values += " -- value"
+            value_values = f"{joined_value_values} -- value"
 
-            upsert_stmt = self._UPSERT_WITH_VALUES_STMT_FMT.format(
-                value_columns=value_columns,
+            upsert_stmt = self._upsert_with_values_stmt_fmt(
+                value_columns=self._value_column_list,
                 value_values=value_values,
                 key_columns=key_columns,
             )
         else:
-            all_columns += " -- key\n    "
-            all_columns += "-- no values defined"
+            all_columns = f"{key_columns}\n    -- no values defined"
             upsert_stmt = self._UPSERT_WITHOUT_VALUES_STMT
 
-        all_values = ",\n    ".join(
-            ["?" for _ in range(0, len(key_column_names) + len(value_column_names))],
-        )
-        unstripped_upsert_statement = self._UPSERT_FMT.format(
-            table_identifier=self.table_ident,
-            all_columns=all_columns,
-            all_values=all_values,
-            timestamp_column=self.TIMESTAMP_COLUMN,
-            upsert_stmt=upsert_stmt,
+        upsert_statement = SqlStatement(
+            self._upsert_fmt(
+                table_identifier=self.table_ident,
+                all_columns=all_columns,
+                all_values=self._all_placeholders,
+                timestamp_column=self.TIMESTAMP_COLUMN,
+                upsert_stmt=upsert_stmt,
+            ),
         )
-
-        upsert_lines = []
-        for line in unstripped_upsert_statement.splitlines():
-            upsert_lines.append(line.rstrip())
-        # needed for trailing newline
-        upsert_lines.append("")
-        upsert_statement = SqlStatement("\n".join(upsert_lines))
-        self._upsert_statement = upsert_statement
         return upsert_statement
 
     # fmt: off
-    _SELECT_FMT: typing.ClassVar[str] = (
-        "-- sqlitecaching retrieve from table\n"
-        "SELECT\n"
-        "    {value_columns}\n"
-        "FROM {table_identifier}\n"
-        "WHERE (\n"
-        "    -- key columns\n"
-        "    {key_columns}\n"
-        ") = (\n"
-        "    -- key values\n"
-        "    {key_values}\n"
-        ") ORDER BY {timestamp_column} {order};\n"
-    )
+    @staticmethod
+    def _select_fmt(
+        *,
+        value_columns: str,
+        table_identifier: str,
+        key_columns: str,
+        key_values: str,
+        timestamp_column: str,
+        order: str,
+    ) -> str:
+        return (
+            "-- sqlitecaching retrieve from table\n"
+            "SELECT\n"
+            f"    {value_columns}\n"
+            f"FROM {table_identifier}\n"
+            "WHERE (\n"
+            "    -- key columns\n"
+            f"    {key_columns}\n"
+            ") = (\n"
+            "    -- key values\n"
+            f"    {key_values}\n"
+            f") ORDER BY {timestamp_column} {order};\n"
+        )
     # fmt: on
 
     def select_statement(self, *, asc: bool = True) -> SqlStatement:
         if asc:
-            if self._select_statement:
-                return self._select_statement
-            order = "ASC"
-        else:
-            if self._tceles_statement:
-                return self._tceles_statement
-            order = "DESC"
+            return self._select_statement
+        return self._tceles_statement
+
+    def _build_select_statement(self, *, asc: bool) -> SqlStatement:
+        order = "ASC" if asc else "DESC"
+
+        if not self.pretty:
+            return SqlStatement(
+                f"SELECT {self._value_column_list or self.TIMESTAMP_COLUMN} "
+                f"FROM {self.table_ident} "
+                f"WHERE ({self._key_column_list}) = ({self._key_placeholders}) "
+                f"ORDER BY {self.TIMESTAMP_COLUMN} {order};",
+            )
 
-        value_column_names = sorted(self.value_idents)
-        if value_column_names:
-            value_columns = ", -- value\n    ".join(value_column_names)
-            value_columns += " -- value"
+        if self._sorted_value_idents:
+            value_columns = self._value_column_list
         else:
             value_columns = (
                 f"{self.TIMESTAMP_COLUMN} -- no value columns so just "
                 f"{self.TIMESTAMP_COLUMN}"
             )
 
-        key_column_names = sorted(self.key_idents)
-        key_columns = ", -- key\n    ".join(key_column_names)
-        key_columns += " -- key"
-
-        key_columns_count = len(key_column_names)
-        key_values = ",\n    ".join(["?" for _ in range(0, key_columns_count)])
-        unstripped_select_statement = self._SELECT_FMT.format(
-            table_identifier=self.table_ident,
-            value_columns=value_columns,
-            key_columns=key_columns,
-            key_values=key_values,
-            timestamp_column=self.TIMESTAMP_COLUMN,
-            order=order,
+        select_statement = SqlStatement(
+            self._select_fmt(
+                table_identifier=self.table_ident,
+                value_columns=value_columns,
+                key_columns=self._key_column_list,
+                key_values=self._key_placeholders,
+                timestamp_column=self.TIMESTAMP_COLUMN,
+                order=order,
+            ),
         )
 
-        select_lines = []
-        for line in unstripped_select_statement.splitlines():
-            select_lines.append(line.rstrip())
-        # needed for trailing newline
-        select_lines.append("")
-        select_statement = SqlStatement("\n".join(select_lines))
-
-        if asc:
-            self._select_statement = select_statement
-        else:
-            self._tceles_statement = select_statement
-
         return select_statement
 
     # fmt: off
-    _REMOVE_FMT: typing.ClassVar[str] = (
-        "-- sqlitecaching remove from table\n"
-        "DELETE FROM {table_identifier}\n"
-        "WHERE (\n"
-        "    -- key columns\n"
-        "    {key_columns}\n"
-        ") = (\n"
-        "    -- key values\n"
-        "    {key_values}\n"
-        ");\n"
-    )
+    @staticmethod
+    def _remove_fmt(*, table_identifier: str, key_columns: str, key_values: str) -> str:
+        return (
+            "-- sqlitecaching remove from table\n"
+            f"DELETE FROM {table_identifier}\n"
+            "WHERE (\n"
+            "    -- key columns\n"
+            f"    {key_columns}\n"
+            ") = (\n"
+            "    -- key values\n"
+            f"    {key_values}\n"
+            ");\n"
+        )
     # fmt: on
 
     def remove_statement(self) -> SqlStatement:
-        if self._remove_statement:
-            return self._remove_statement
-
-        key_column_names = sorted(self.key_idents)
-        key_columns = ", -- key\n    ".join(key_column_names)
-        key_columns += " -- key"
-
-        key_columns_count = len(key_column_names)
-        key_values = ",\n    ".join(["?" for _ in range(0, key_columns_count)])
-        unstripped_remove_statement = self._REMOVE_FMT.format(
-            table_identifier=self.table_ident,
-            key_columns=key_columns,
-            key_values=key_values,
-        )
+        return self._remove_statement
+
+    def _build_remove_statement(self) -> SqlStatement:
+        if not self.pretty:
+            return SqlStatement(
+                f"DELETE FROM {self.table_ident} "
+                f"WHERE ({self._key_column_list}) = ({self._key_placeholders});",
+            )
 
-        remove_lines = []
-        for line in unstripped_remove_statement.splitlines():
-            remove_lines.append(line.rstrip())
-        # needed for trailing newline
-        remove_lines.append("")
-        remove_statement = SqlStatement("\n".join(remove_lines))
-        self._remove_statement = remove_statement
+        remove_statement = SqlStatement(
+            self._remove_fmt(
+                table_identifier=self.table_ident,
+                key_columns=self._key_column_list,
+                key_values=self._key_placeholders,
+            ),
+        )
         return remove_statement
 
     # fmt: off
-    _LENGTH_FMT: typing.ClassVar[str] = (
-        "-- sqlitecaching table length\n"
-        "SELECT {count_column} FROM {table_identifier};\n"
-    )
+    @staticmethod
+    def _length_fmt(*, count_column: str, table_identifier: str) -> str:
+        return (
+            "-- sqlitecaching table length\n"
+            f"SELECT {count_column} FROM {table_identifier};\n"
+        )
     # fmt: on
 
     def length_statement(self) -> SqlStatement:
-        if self._length_statement:
-            return self._length_statement
+        return self._length_statement
 
-        unstripped_length_statement = self._LENGTH_FMT.format(
-            count_column=self.COUNT_COLUMN,
-            table_identifier=self.table_ident,
-        )
+    def _build_length_statement(self) -> SqlStatement:
+        if not self.pretty:
+            return SqlStatement(
+                f"SELECT {self.COUNT_COLUMN} FROM {self.table_ident};",
+            )
 
-        length_lines = []
-        for line in unstripped_length_statement.splitlines():
-            length_lines.append(line.rstrip())
-        # needed for trailing newline
-        length_lines.append("")
-        length_statement = SqlStatement("\n".join(length_lines))
-        self._length_statement = length_statement
+        length_statement = SqlStatement(
+            self._length_fmt(
+                count_column=self.COUNT_COLUMN,
+                table_identifier=self.table_ident,
+            ),
+        )
         return length_statement
 
     # fmt: off
-    _KEYS_FMT: typing.ClassVar[str] = (
-        "-- sqlitecaching table keys\n"
-        "SELECT\n"
-        "    {key_columns}\n"
-        "FROM {table_identifier}\n"
-        "ORDER BY {timestamp_column} {order};\n"
-    )
+    @staticmethod
+    def _keys_fmt(
+        *,
+        key_columns: str,
+        table_identifier: str,
+        timestamp_column: str,
+        order: str,
+    ) -> str:
+        return (
+            "-- sqlitecaching table keys\n"
+            "SELECT\n"
+            f"    {key_columns}\n"
+            f"FROM {table_identifier}\n"
+            f"ORDER BY {timestamp_column} {order};\n"
+        )
     # fmt: on
 
     def keys_statement(self, *, asc: bool = True) -> SqlStatement:
         if asc:
-            if self._keys_statement:
-                return self._keys_statement
-            order = "ASC"
-        else:
-            if self._syek_statement:
-                return self._syek_statement
-            order = "DESC"
-
-        key_column_names = sorted(self.key_idents)
-        key_columns = ", -- key\n    ".join(key_column_names)
-        key_columns += " -- key"
-
-        unstripped_keys_statement = self._KEYS_FMT.format(
-            key_columns=key_columns,
-            table_identifier=self.table_ident,
-            timestamp_column=self.TIMESTAMP_COLUMN,
-            order=order,
-        )
+            return self._keys_statement
+        return self._syek_statement
 
-        keys_lines = []
-        for line in unstripped_keys_statement.splitlines():
-            keys_lines.append(line.rstrip())
-        # needed for trailing newline
-        keys_lines.append("")
-        keys_statement = SqlStatement("\n".join(keys_lines))
+    def _build_keys_statement(self, *, asc: bool) -> SqlStatement:
+        order = "ASC" if asc else "DESC"
 
-        if asc:
-            self._keys_statement = keys_statement
-        else:
-            self._syek_statement = keys_statement
+        if not self.pretty:
+            return SqlStatement(
+                f"SELECT {self._key_column_list} FROM {self.table_ident} "
+                f"ORDER BY {self.TIMESTAMP_COLUMN} {order};",
+            )
+
+        keys_statement = SqlStatement(
+            self._keys_fmt(
+                key_columns=self._key_column_list,
+                table_identifier=self.table_ident,
+                timestamp_column=self.TIMESTAMP_COLUMN,
+                order=order,
+            ),
+        )
 
         return keys_statement
 
     # fmt: off
-    _BOOL_FMT: typing.ClassVar[str] = (
-        "-- sqlitecaching table bool\n"
-        "-- either returns nothing or one {timestamp_column} to indicate that some\n"
-        "-- value is stored\n"
-        "SELECT\n"
-        "    {timestamp_column}\n"
-        "FROM {table_identifier}\n"
-        "LIMIT 1;\n"
-    )
+    @staticmethod
+    def _bool_fmt(*, timestamp_column: str, table_identifier: str) -> str:
+        return (
+            "-- sqlitecaching table bool\n"
+            f"-- either returns nothing or one {timestamp_column} to indicate "
+            "that some\n"
+            "-- value is stored\n"
+            "SELECT\n"
+            f"    {timestamp_column}\n"
+            f"FROM {table_identifier}\n"
+            "LIMIT 1;\n"
+        )
     # fmt: on
 
     def bool_statement(self) -> SqlStatement:
-        if self._bool_statement:
-            return self._bool_statement
+        return self._bool_statement
+
+    def _build_bool_statement(self) -> SqlStatement:
+        if not self.pretty:
+            return SqlStatement(
+                f"SELECT {self.TIMESTAMP_COLUMN} FROM {self.table_ident} LIMIT 1;",
+            )
 
         bool_statement = SqlStatement(
-            self._BOOL_FMT.format(
+            self._bool_fmt(
                 timestamp_column=self.TIMESTAMP_COLUMN,
                 table_identifier=self.table_ident,
             ),
         )
-        self._bool_statement = bool_statement
         return bool_statement
 
     # fmt: off
-    _ITEMS_FMT: typing.ClassVar[str] = (
-        "-- sqlitecaching table items\n"
-        "SELECT\n"
-        "    -- all columns\n"
-        "    {all_columns}\n"
-        "FROM {table_identifier}\n"
-        "ORDER BY {timestamp_column} {order};\n"
-    )
+    @staticmethod
+    def _items_fmt(
+        *,
+        all_columns: str,
+        table_identifier: str,
+        timestamp_column: str,
+        order: str,
+    ) -> str:
+        return (
+            "-- sqlitecaching table items\n"
+            "SELECT\n"
+            "    -- all columns\n"
+            f"    {all_columns}\n"
+            f"FROM {table_identifier}\n"
+            f"ORDER BY {timestamp_column} {order};\n"
+        )
     # fmt: on
 
     def items_statement(self, *, asc: bool = True) -> SqlStatement:
         if asc:
-            if self._items_statement:
-                return self._items_statement
-            order = "ASC"
-        else:
-            if self._smeti_statement:
-                return self._smeti_statement
-            order = "DESC"
+            return self._items_statement
+        return self._smeti_statement
 
-        key_column_names = sorted(self.key_idents)
-        all_columns = ", -- key\n    ".join(key_column_names)
+    def _build_items_statement(self, *, asc: bool) -> SqlStatement:
+        order = "ASC" if asc else "DESC"
 
-        value_column_names = sorted(self.value_idents)
-        if value_column_names:
-            all_columns += ", -- key\n    "
-            all_columns += ", -- value\n    ".join(value_column_names)
-            all_columns += " -- value"
-        else:
-            all_columns += " -- key"
+        if not self.pretty:
+            return SqlStatement(
+                f"SELECT {self._all_column_list} FROM {self.table_ident} "
+                f"ORDER BY {self.TIMESTAMP_COLUMN} {order};",
+            )
 
-        unstripped_items_statement = self._ITEMS_FMT.format(
-            all_columns=all_columns,
-            table_identifier=self.table_ident,
-            timestamp_column=self.TIMESTAMP_COLUMN,
-            order=order,
+        items_statement = SqlStatement(
+            self._items_fmt(
+                all_columns=self._all_column_list,
+                table_identifier=self.table_ident,
+                timestamp_column=self.TIMESTAMP_COLUMN,
+                order=order,
+            ),
         )
 
-        items_lines = []
-        for line in unstripped_items_statement.splitlines():
-            items_lines.append(line.rstrip())
-        # needed for trailing newline
-        items_lines.append("")
-        items_statement = SqlStatement("\n".join(items_lines))
-
-        if asc:
-            self._items_statement = items_statement
-        else:
-            self._smeti_statement = items_statement
-
         return items_statement
 
     # fmt: off
-    _VALUES_FMT: typing.ClassVar[str] = (
-        "-- sqlitecaching table values\n"
-        "SELECT\n"
-        "    {value_columns}\n"
-        "FROM {table_identifier}\n"
-        "ORDER BY {timestamp_column} {order};\n"
-    )
+    @staticmethod
+    def _values_fmt(
+        *,
+        value_columns: str,
+        table_identifier: str,
+        timestamp_column: str,
+        order: str,
+    ) -> str:
+        return (
+            "-- sqlitecaching table values\n"
+            "SELECT\n"
+            f"    {value_columns}\n"
+            f"FROM {table_identifier}\n"
+            f"ORDER BY {timestamp_column} {order};\n"
+        )
     # fmt: on
 
     def values_statement(self, *, asc: bool = True) -> SqlStatement:
         if asc:
-            if self._values_statement:
-                return self._values_statement
-            order = "ASC"
-        else:
-            if self._seulav_statement:
-                return self._seulav_statement
-            order = "DESC"
+            return self._values_statement
+        return self._seulav_statement
 
-        value_column_names = sorted(self.value_idents)
-        if value_column_names:
-            value_columns = ", -- value\n    ".join(value_column_names)
-            value_columns += " -- value"
+    def _build_values_statement(self, *, asc: bool) -> SqlStatement:
+        order = "ASC" if asc else "DESC"
+
+        if not self.pretty:
+            return SqlStatement(
+                f"SELECT {self._value_column_list or self.TIMESTAMP_COLUMN} "
+                f"FROM {self.table_ident} "
+                f"ORDER BY {self.TIMESTAMP_COLUMN} {order};",
+            )
+
+        if self._sorted_value_idents:
+            value_columns = self._value_column_list
         else:
             value_columns = (
                 f"{self.TIMESTAMP_COLUMN} -- {self.TIMESTAMP_COLUMN} value to "
                 "permit querying"
             )
 
-        unstripped_values_statement = self._VALUES_FMT.format(
-            value_columns=value_columns,
-            table_identifier=self.table_ident,
-            timestamp_column=self.TIMESTAMP_COLUMN,
-            order=order,
+        values_statement = SqlStatement(
+            self._values_fmt(
+                value_columns=value_columns,
+                table_identifier=self.table_ident,
+                timestamp_column=self.TIMESTAMP_COLUMN,
+                order=order,
+            ),
         )
 
-        values_lines = []
-        for line in unstripped_values_statement.splitlines():
-            values_lines.append(line.rstrip())
-        # needed for trailing newline
-        values_lines.append("")
-        values_statement = SqlStatement("\n".join(values_lines))
-
-        if asc:
-            self._values_statement = values_statement
-        else:
-            self._seulav_statement = values_statement
-
         return values_statement
+
+    # the method building each statement slot, and the keyword arguments
+    # it takes. Methods are looked up on the instance by name so that
+    # subclasses overriding a builder are honoured.
+    _STATEMENT_BUILDERS: typing.ClassVar[
+        typing.Mapping[str, typing.Tuple[str, typing.Mapping[str, bool]]]
+    ] = {
+        "_create_statement": ("_build_create_statement", {}),
+        "_clear_statement": ("_build_clear_statement", {}),
+        "_delete_statement": ("_build_delete_statement", {}),
+        "_upsert_statement": ("_build_upsert_statement", {}),
+        "_select_statement": ("_build_select_statement", {"asc": True}),
+        "_tceles_statement": ("_build_select_statement", {"asc": False}),
+        "_remove_statement": ("_build_remove_statement", {}),
+        "_length_statement": ("_build_length_statement", {}),
+        "_keys_statement": ("_build_keys_statement", {"asc": True}),
+        "_syek_statement": ("_build_keys_statement", {"asc": False}),
+        "_items_statement": ("_build_items_statement", {"asc": True}),
+        "_smeti_statement": ("_build_items_statement", {"asc": False}),
+        "_values_statement": ("_build_values_statement", {"asc": True}),
+        "_seulav_statement": ("_build_values_statement", {"asc": False}),
+        "_bool_statement": ("_build_bool_statement", {}),
+    }
+
+
+# the identifiers depend only on the (hashable) dataclass pair, keyed on the
+# types alone. CacheDictMapping.__init__ checks both are dataclasses before
+# calling. Invalid pairs raise and are never cached.
+@functools.lru_cache(maxsize=128)
+def _resolve_schema(
+    key_type: typing.Type[typing.Any],
+    value_type: typing.Type[typing.Any],
+    /,
+) -> typing.Tuple[typing.FrozenSet[ValidIdent], typing.FrozenSet[ValidIdent]]:
+    key_idents = CacheDictMapping._validate_idents(dataclasses.fields(key_type))
+    value_idents = CacheDictMapping._validate_idents(dataclasses.fields(value_type))
+
+    if not key_idents:
+        raise CacheDictMappingMissingKeysException({"no_keys": key_idents})
+
+    overlap_idents = key_idents & value_idents
+    if overlap_idents:
+        raise CacheDictMappingKeyValOverlapException({"columns": overlap_idents})
+
+    return (key_idents, value_idents)
+
+
+# backs CacheDictMapping.cached, see there
+@functools.lru_cache(maxsize=256)
+def _cached_mapping(
+    args: typing.Tuple[
+        typing.Type[CacheDictMapping[typing.Any, typing.Any]],
+        IdentIn,
+        typing.Type[typing.Any],
+        typing.Type[typing.Any],
+        typing.Any,
+        typing.Any,
+        bool,
+    ],
+    /,
+) -> CacheDictMapping[typing.Any, typing.Any]:
+    (cls, table, key_type, value_type, key_types, value_types, pretty) = args
+    return cls(
+        table=table,
+        key_type=key_type,
+        value_type=value_type,
+        key_types=key_types,
+        value_types=value_types,
+        pretty=pretty,
+    )
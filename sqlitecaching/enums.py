@@ -1,5 +1,4 @@
 import enum
-import functools
 import logging
 import typing
 
@@ -24,12 +23,12 @@ except NameError:
             "duplicated between [{existing_name}] and  [{new_name}]"
         ),
         params=frozenset(
-            [
+            (
                 "duplicated_value",
                 "enum_name",
                 "existing_name",
                 "new_name",
-            ],
+            ),
         ),
     )
     EnumNameClashException = EnumCategory.register_cause(
@@ -40,12 +39,12 @@ except NameError:
             "and [{new_name}] (names are casefold()ed to [{casefolded_name}])"
         ),
         params=frozenset(
-            [
+            (
                 "enum_name",
                 "existing_name",
                 "new_name",
                 "casefolded_name",
-            ],
+            ),
         ),
     )
     EnumValueConversionException = EnumCategory.register_cause(
@@ -56,27 +55,57 @@ except NameError:
             "value found"
         ),
         params=frozenset(
-            [
+            (
                 "to_convert",
                 "enum_name",
-            ],
+            ),
         ),
     )
+    EnumMemberTypeException = EnumCategory.register_cause(
+        cause_name=f"{__name__}.EnumMemberTypeException",
+        cause_id=3,
+        fmt="[{member!r}] is not a member of [{enum_name}]",
+        params=frozenset(
+            (
+                "member",
+                "enum_name",
+            ),
+        ),
+        additional_excepts=frozenset((TypeError,)),
+    )
 
 T = typing.TypeVar("T", bound="LevelledEnum")
 
+# for ascii input, equivalent to .replace("-", "_").casefold() in one pass
+_ASCII_NORMALISE = str.maketrans(
+    "-ABCDEFGHIJKLMNOPQRSTUVWXYZ",
+    "_abcdefghijklmnopqrstuvwxyz",
+)
+
 
-@functools.total_ordering
 class LevelledEnum(enum.Enum):
+    _names_by_value: typing.ClassVar[typing.Dict[typing.Any, str]]
+    _names_by_casefold: typing.ClassVar[typing.Dict[str, str]]
+    _value_strs: typing.ClassVar[typing.FrozenSet[str]]
+    _bit: int
+
     def __init__(self, *args):
         cls = self.__class__
         enum_name = cls.__name__
-        matching_values = [
-            existing.name for existing in cls if existing.value == self.value
-        ]
-        if matching_values:
+        # indexes of the members defined so far, created with the first member
+        # and kept on the class so each check is a single lookup
+        try:
+            names_by_value = cls.__dict__["_names_by_value"]
+            names_by_casefold = cls.__dict__["_names_by_casefold"]
+        except KeyError:
+            names_by_value = {}
+            names_by_casefold = {}
+            cls._names_by_value = names_by_value
+            cls._names_by_casefold = names_by_casefold
+
+        existing_name = names_by_value.get(self.value)
+        if existing_name is not None:
             new_name = self.name
-            existing_name = matching_values[0]
             raise EnumDuplicateValueException(
                 {
                     "enum_name": enum_name,
@@ -85,15 +114,10 @@ class LevelledEnum(enum.Enum):
                     "duplicated_value": self.value,
                 },
             )
-        matching_names = [
-            existing.name
-            for existing in cls
-            if existing.name.casefold() == self.name.casefold()
-        ]
-        if matching_names:
+        casefolded_name = self.name.casefold()
+        existing_name = names_by_casefold.get(casefolded_name)
+        if existing_name is not None:
             new_name = self.name
-            existing_name = matching_names[0]
-            casefolded_name = new_name.casefold()
             raise EnumNameClashException(
                 {
                     "enum_name": enum_name,
@@ -102,22 +126,50 @@ class LevelledEnum(enum.Enum):
                     "casefolded_name": casefolded_name,
                 },
             )
+        # members are numbered in definition order, see as_bit
+        self._bit = 1 << len(names_by_value)
+        names_by_value[self.value] = self.name
+        names_by_casefold[casefolded_name] = self.name
 
     def __lt__(self, other: "LevelledEnum"):
         if self.__class__ is other.__class__:
             return self.value < other.value
         return NotImplemented
 
+    def __le__(self, other: "LevelledEnum"):
+        if self.__class__ is other.__class__:
+            return self.value <= other.value
+        return NotImplemented
+
+    def __gt__(self, other: "LevelledEnum"):
+        if self.__class__ is other.__class__:
+            return self.value > other.value
+        return NotImplemented
+
+    def __ge__(self, other: "LevelledEnum"):
+        if self.__class__ is other.__class__:
+            return self.value >= other.value
+        return NotImplemented
+
     def __eq__(self, other):
         if self.__class__ is other.__class__:
             return self.value == other.value
         return NotImplemented
 
+    # defining __eq__ would otherwise leave members unhashable
+    def __hash__(self):
+        return hash(self.value)
+
     @classmethod
     def convert(cls: typing.Type[T], value: str) -> T:
-        for candidate in cls:
-            if value.replace("-", "_").casefold() == candidate._name_.casefold():
-                return candidate
+        names_by_casefold = getattr(cls, "_names_by_casefold", {})
+        if value.isascii():
+            normalised = value.translate(_ASCII_NORMALISE)
+        else:
+            normalised = value.replace("-", "_").casefold()
+        name = names_by_casefold.get(normalised)
+        if name is not None:
+            return cls[name]
         raise EnumValueConversionException(
             {
                 "enum_name": cls.__name__,
@@ -125,12 +177,37 @@ class LevelledEnum(enum.Enum):
             },
         )
 
+    # sets of members as int bitmasks, union and intersection are then | and &
+    # on ints. Intended for small enums such as LogLevel, the masks grow by one
+    # bit per member.
+    @classmethod
+    def as_bit(cls: typing.Type[T], member: T, /) -> int:
+        if member.__class__ is not cls:
+            raise EnumMemberTypeException(
+                {
+                    "enum_name": cls.__name__,
+                    "member": member,
+                },
+            )
+        return member._bit
+
+    @classmethod
+    def bitset(cls: typing.Type[T], members: typing.Iterable[T], /) -> int:
+        bits = 0
+        for member in members:
+            bits |= cls.as_bit(member)
+        return bits
+
     @classmethod
     def value_strs(cls) -> typing.FrozenSet[str]:
-        values: typing.FrozenSet[str] = frozenset([])
-        for candidate in cls:
-            values = values | frozenset([candidate._name_.replace("_", "-").casefold()])
-        return values
+        # members cannot change once the class exists, so build this only once
+        value_strs = cls.__dict__.get("_value_strs")
+        if value_strs is None:
+            value_strs = frozenset(
+                [candidate._name_.replace("_", "-").casefold() for candidate in cls],
+            )
+            cls._value_strs = value_strs
+        return value_strs
 
 
 class LogLevel(LevelledEnum):
@@ -19,11 +19,29 @@ CauseInt = typing.Union[CauseID, int]
 T = typing.TypeVar("T", bound="SqliteCachingException")
 
 
+def _log_if_enabled(
+    level: int,
+    msg: str,
+    /,
+    *args: typing.Any,
+    **kwargs: typing.Any,
+) -> None:
+    # exceptions are often raised and handled without anything being logged,
+    # so check the level before any record is made
+    if log.isEnabledFor(level):
+        # +1 stacklevel for this helper
+        kwargs["stacklevel"] = kwargs.get("stacklevel", 1) + 1
+        log.log(level, msg, *args, **kwargs)
+
+
 class Cause(typing.NamedTuple):
     id: CauseID
     name: Name
     fmt: Format
     params: ParamSet
+    # fmt.format, bound once at registration, or None when fmt has no
+    # replacement fields and is the message as is
+    formatter: typing.Optional[typing.Callable[..., str]]
 
 
 class Category(typing.NamedTuple):
@@ -57,7 +75,7 @@ class ExceptProvider(typing.Generic[T]):
         ] = None,
     ):
         if not additional_excepts:
-            additional_excepts = frozenset([])
+            additional_excepts = frozenset()
         self.subcls = type(
             str(cause_name),
             (except_cls, *additional_excepts),
@@ -73,12 +91,8 @@ class ExceptProvider(typing.Generic[T]):
         params: ParamMap,
         /,
     ) -> T:
-        return self.subcls(
-            category_id=self.category_id,
-            cause_id=self.id,
-            params=params,
-            stacklevel=2,
-        )
+        # passed positionally, this is the path every raise goes through
+        return self.subcls(self.category_id, self.id, params, 2)
 
 
 class CategoryProvider(typing.Generic[T]):
@@ -121,40 +135,37 @@ class CategoryProvider(typing.Generic[T]):
             additional_excepts,
         )
 
-        category = _CATEGORY_REG.get(self.id, None)
-        if not category:
-            raise SqliteCachingException(
-                category_id=CategoryID(0),
-                cause_id=CauseID(4),
-                params={
+        try:
+            category = _CATEGORY_REG[self.id]
+        except KeyError:
+            raise SqliteCachingException._meta_exception(
+                CauseID(4),
+                {
                     "category_id": self.id,
                     "cause_id": cause_id,
                     "cause_name": cause_name,
                 },
-                stacklevel=1,
-            )
-        causes = category.causes
-        existing_cause = causes.get(cause_id, None)
-        if existing_cause:
-            raise SqliteCachingException(
-                category_id=CategoryID(0),
-                cause_id=CauseID(3),
-                params={
-                    "cause_id": cause_id,
-                    "existing_cause_name": existing_cause.name,
-                    "cause_name": cause_name,
-                },
-                stacklevel=1,
             )
         cause = Cause(
             id=cause_id,
             name=cause_name,
             fmt=fmt,
             params=params,
+            formatter=fmt.format if ("{" in fmt or "}" in fmt) else None,
         )
-        causes[cause_id] = cause
+        # inserts and checks for an existing cause in one probe
+        existing_cause = category.causes.setdefault(cause_id, cause)
+        if existing_cause is not cause:
+            raise SqliteCachingException._meta_exception(
+                CauseID(3),
+                {
+                    "cause_id": cause_id,
+                    "existing_cause_name": existing_cause.name,
+                    "cause_name": cause_name,
+                },
+            )
 
-        return ExceptProvider[T](
+        return ExceptProvider(
             except_cls=self.except_cls,
             category_id=self.id,
             cause_id=cause_id,
@@ -165,6 +176,7 @@ class CategoryProvider(typing.Generic[T]):
 
 class SqliteCachingException(Exception):
     _raise_on_additional_params: typing.ClassVar[bool] = False
+    _log_stack_info: typing.ClassVar[bool] = False
 
     category: Category
     cause: Cause
@@ -173,91 +185,121 @@ class SqliteCachingException(Exception):
 
     def __init__(
         self,
-        *,
         category_id: CategoryID,
         cause_id: CauseID,
         params: ParamMap,
         stacklevel: int,
     ):
-        self.params = params
-
         try:
-            self.category = _CATEGORY_REG[category_id]
+            category = _CATEGORY_REG[category_id]
         except KeyError:
-            raise SqliteCachingException(
-                category_id=CategoryID(0),
-                cause_id=CauseID(0),
-                params={"category_id": category_id},
-                stacklevel=1,
+            raise SqliteCachingException._meta_exception(
+                CauseID(0),
+                {"category_id": category_id},
             )
         try:
-            self.cause = self.category.causes[cause_id]
+            cause = category.causes[cause_id]
         except KeyError:
-            raise SqliteCachingException(
-                category_id=CategoryID(0),
-                cause_id=CauseID(2),
-                params={
+            raise SqliteCachingException._meta_exception(
+                CauseID(2),
+                {
                     "cause_id": cause_id,
                     "category_id": category_id,
-                    "category_name": self.category.name,
+                    "category_name": category.name,
                 },
-                stacklevel=1,
             )
-        fmt = self.cause.fmt
-        expected_params = self.cause.params
-        provided_params = frozenset(self.params.keys())
-
-        missing_params = expected_params - provided_params
-        if missing_params:
-            log.error("expected parameters not provided: [%s]", missing_params)
-            raise SqliteCachingException(
-                category_id=CategoryID(0),
-                cause_id=CauseID(5),
-                params={
-                    "category_id": category_id,
-                    "category_name": self.category.name,
-                    "cause_id": cause_id,
-                    "cause_name": self.cause.name,
-                    "missing_params": missing_params,
-                },
-                stacklevel=1,
-            )
-
-        additional_params = {
-            k: self.params[k] for k in (provided_params - expected_params)
-        }
-        if additional_params:
-            log.warning(
-                "unexpected additional parameters provided: [%s]",
-                additional_params,
-            )
-            if self.raise_on_additional_params():
-                raise SqliteCachingException(
-                    category_id=CategoryID(0),
-                    cause_id=CauseID(6),
-                    params={
+        expected_params = cause.params
+
+        # the common case, exactly the expected params, is a single keys view
+        # comparison with no allocation; only a mismatch works out which
+        # params are missing or additional
+        if params.keys() != expected_params:
+            missing_params = expected_params.difference(params)
+            if missing_params:
+                _log_if_enabled(
+                    logging.ERROR,
+                    "expected parameters not provided: [%s]",
+                    missing_params,
+                )
+                raise SqliteCachingException._meta_exception(
+                    CauseID(5),
+                    {
                         "category_id": category_id,
-                        "category_name": self.category.name,
+                        "category_name": category.name,
                         "cause_id": cause_id,
-                        "cause_name": self.cause.name,
-                        "additional_params": additional_params,
+                        "cause_name": cause.name,
+                        "missing_params": missing_params,
                     },
-                    stacklevel=1,
                 )
 
-        self.msg = fmt.format(**self.params)
+            # the additional params are only collected if they will be
+            # logged or raised
+            additional_keys = params.keys() - expected_params
+            raise_on_additional = self.raise_on_additional_params()
+            if additional_keys and (
+                raise_on_additional or log.isEnabledFor(logging.WARNING)
+            ):
+                additional_params = {k: params[k] for k in additional_keys}
+                _log_if_enabled(
+                    logging.WARNING,
+                    "unexpected additional parameters provided: [%s]",
+                    additional_params,
+                )
+                if raise_on_additional:
+                    raise SqliteCachingException._meta_exception(
+                        CauseID(6),
+                        {
+                            "category_id": category_id,
+                            "category_name": category.name,
+                            "cause_id": cause_id,
+                            "cause_name": cause.name,
+                            "additional_params": additional_params,
+                        },
+                    )
+
+        self._init_state(category, cause, params)
+
+    def _init_state(
+        self,
+        category: Category,
+        cause: Cause,
+        params: ParamMap,
+        /,
+    ) -> None:
+        self.category = category
+        self.cause = cause
+        self.params = params
+        formatter = cause.formatter
+        self.msg = cause.fmt if formatter is None else formatter(**params)
 
-        log.error("Exception: [%s]", self.msg)
-        log.debug(
+        _log_if_enabled(logging.ERROR, "Exception: [%s]", self.msg)
+        # +1 stacklevel for this method
+        _log_if_enabled(
+            logging.DEBUG,
             "raising [%s] with msg [%s]",
             type(self).__name__,
             self.msg,
-            stack_info=True,
-            stacklevel=4,
+            stack_info=self._log_stack_info,
+            stacklevel=5,
         )
 
         super().__init__(self.msg)
 
+    @classmethod
+    def _meta_exception(
+        cls,
+        cause_id: CauseID,
+        params: ParamMap,
+        /,
+    ) -> "SqliteCachingException":
+        # the meta causes are registered by this module and are always given
+        # their expected params, so the param checks made by __init__ are not
+        # needed when reporting a failure inside them
+        category = _CATEGORY_REG[CategoryID(0)]
+        self = cls.__new__(cls)
+        self._init_state(category, category.causes[cause_id], params)
+        return self
+
     @classmethod
     def raise_on_additional_params(
         cls,
@@ -273,6 +315,21 @@ class SqliteCachingException(Exception):
             cls._raise_on_additional_params = should_raise
         return cls._raise_on_additional_params
 
+    @classmethod
+    def log_stack_info(
+        cls,
+        should_log: typing.Optional[bool] = None,
+        /,
+    ) -> bool:
+        if should_log is not None:
+            log.warning(
+                "setting [%s]._log_stack_info to [%s]",
+                cls.__name__,
+                should_log,
+            )
+            cls._log_stack_info = should_log
+        return cls._log_stack_info
+
     @classmethod
     def register_category(
         cls: typing.Type[T],
@@ -285,23 +342,20 @@ class SqliteCachingException(Exception):
 
         log.info("registering category [%s] with id [%d]", category_name, category_id)
 
-        existing_category = _CATEGORY_REG.get(category_id, None)
-        if existing_category:
-            raise SqliteCachingException(
-                category_id=CategoryID(0),
-                cause_id=CauseID(1),
-                params={
+        category = Category(id=category_id, name=category_name, causes={})
+        # inserts and checks for an existing category in one probe
+        existing_category = _CATEGORY_REG.setdefault(category_id, category)
+        if existing_category is not category:
+            raise SqliteCachingException._meta_exception(
+                CauseID(1),
+                {
                     "category_id": category_id,
                     "existing_category_name": existing_category.name,
                     "category_name": category_name,
                 },
-                stacklevel=1,
             )
 
-        category = Category(id=category_id, name=category_name, causes={})
-        _CATEGORY_REG[category_id] = category
-
-        return CategoryProvider[T](
+        return CategoryProvider(
             except_cls=cls,
             category_id=category_id,
             category_name=category_name,
@@ -320,7 +374,7 @@ except NameError:
         cause_name=f"{__name__}.SqliteCachingMissingCategoryException",
         cause_id=0,
         fmt="No category matching {category_id} was found",
-        params=frozenset(["category_id"]),
+        params=frozenset(("category_id",)),
     )
     SqliteCachingDuplicateCategoryException = SqliteCachingMetaCategory.register_cause(
         cause_name=f"{__name__}.SqliteCachingDuplicateCategoryException",
@@ -329,7 +383,7 @@ except NameError:
             "previously registered category with id [{category_id} "
             "({existing_category_name})], cannot overwrite with [{category_name}]"
         ),
-        params=frozenset(["category_id", "existing_category_name", "category_name"]),
+        params=frozenset(("category_id", "existing_category_name", "category_name")),
     )
     SqliteCachingMissingCauseException = SqliteCachingMetaCategory.register_cause(
         cause_name=f"{__name__}.SqliteCachingMissingCauseException",
@@ -338,7 +392,7 @@ except NameError:
             "No cause matching {cause_id} was found for category: [{category_id} "
             "({category_name})]"
         ),
-        params=frozenset(["cause_id", "category_id", "category_name"]),
+        params=frozenset(("cause_id", "category_id", "category_name")),
     )
     SqliteCachingDuplicateCauseException = SqliteCachingMetaCategory.register_cause(
         cause_name=f"{__name__}.SqliteCachingMissingCauseException",
@@ -347,7 +401,7 @@ except NameError:
             "previously registered cause with id [{cause_id} ({existing_cause_name})], "
             "cannot overwrite with [{cause_name}]"
         ),
-        params=frozenset(["cause_id", "existing_cause_name", "cause_name"]),
+        params=frozenset(("cause_id", "existing_cause_name", "cause_name")),
     )
     SqliteCachingNoCategoryForCauseException = SqliteCachingMetaCategory.register_cause(
         cause_name=f"{__name__}.SqliteCachingNoCategoryForCauseException",
@@ -357,11 +411,11 @@ except NameError:
             "registering exception with cause_id [{cause_id} ({cause_name})]"
         ),
         params=frozenset(
-            [
+            (
                 "category_id",
                 "cause_id",
                 "cause_name",
-            ],
+            ),
         ),
     )
     SqliteCachingMissingParamsException = SqliteCachingMetaCategory.register_cause(
@@ -373,13 +427,13 @@ except NameError:
             "({cause_name})]: [{missing_params}]"
         ),
         params=frozenset(
-            [
+            (
                 "category_id",
                 "category_name",
                 "cause_id",
                 "cause_name",
                 "missing_params",
-            ],
+            ),
         ),
     )
     SqliteCachingAdditionalParamsException = SqliteCachingMetaCategory.register_cause(
@@ -391,12 +445,12 @@ except NameError:
             "({cause_name})]: [{additional_params}]"
         ),
         params=frozenset(
-            [
+            (
                 "category_id",
                 "category_name",
                 "cause_id",
                 "cause_name",
                 "additional_params",
-            ],
+            ),
         ),
     )
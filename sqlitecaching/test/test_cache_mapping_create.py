@@ -1,6 +1,7 @@
 import dataclasses
 import itertools
 import logging
+import sqlite3
 import typing
 from dataclasses import dataclass
 
@@ -326,6 +327,28 @@ class TestCacheDictMapping(SqliteCachingTestBase):
                 value_type=A,
             ),
         ),
+        FailInputDef(
+            result=FailRes(
+                name="invalid_key_field_name",
+                exception=CacheDictMappingInvalidIdentifierException,
+            ),
+            mapping=InvIn(
+                table="aa_aa__bb",
+                key_type=AA,
+                value_type=B,
+            ),
+        ),
+        FailInputDef(
+            result=FailRes(
+                name="invalid_value_field_name",
+                exception=CacheDictMappingInvalidIdentifierException,
+            ),
+            mapping=InvIn(
+                table="cc__bb_bb",
+                key_type=C,
+                value_type=BB,
+            ),
+        ),
         FailInputDef(
             result=FailRes(
                 name="reserved_table_name",
@@ -483,6 +506,7 @@ class TestCacheDictMapping(SqliteCachingTestBase):
             key_types=mapping.key_types,
             value_type=mapping.value_type,
             value_types=mapping.value_types,
+            pretty=True,
         )
         log.debug("created CacheDictMapping: %s", actual)
         expected = f"{statement_type}_{result_name}.sql"
@@ -527,6 +551,50 @@ class TestCacheDictMapping(SqliteCachingTestBase):
             )
             self.assertIs(actual_inverted_statement, actual_second_inverted_statement)
 
+    create_mapping_compact_params = [
+        (input_def.mapping.table, input_def.mapping)
+        for input_def in success_mapping_definitions
+    ]
+
+    @parameterized.parameterized.expand(create_mapping_compact_params)
+    def test_create_mapping_compact(self, name: str, mapping: In):
+        log.debug("create compact CacheDictMapping")
+        actual = CacheDictMapping(  # typing: ignore
+            table=mapping.table,
+            key_type=mapping.key_type,
+            key_types=mapping.key_types,
+            value_type=mapping.value_type,
+            value_types=mapping.value_types,
+        )
+        for statement_type in self.statement_types:
+            statement = getattr(actual, statement_type)()
+            self.assertNotIn("--", statement)
+            self.assertNotIn("\n", statement)
+
+        key_count = len(dataclasses.fields(mapping.key_type))
+        value_count = len(dataclasses.fields(mapping.value_type))
+        key_params = ["k"] * key_count
+        all_params = ["ts"] + key_params + ["v"] * value_count
+
+        # the compacted statements must still be accepted by sqlite
+        conn = sqlite3.connect(":memory:")
+        try:
+            conn.execute(actual.create_statement())
+            conn.execute(actual.upsert_statement(), all_params)
+            conn.execute(actual.upsert_statement(), all_params)
+            for asc in (True, False):
+                conn.execute(actual.select_statement(asc=asc), key_params)
+                conn.execute(actual.keys_statement(asc=asc))
+                conn.execute(actual.items_statement(asc=asc))
+                conn.execute(actual.values_statement(asc=asc))
+            self.assertEqual(conn.execute(actual.length_statement()).fetchone(), (1,))
+            conn.execute(actual.bool_statement())
+            conn.execute(actual.remove_statement(), key_params)
+            conn.execute(actual.clear_statement())
+            conn.execute(actual.delete_statement())
+        finally:
+            conn.close()
+
     @parameterized.parameterized.expand(create_mapping_fail_params)
     def test_create_mapping_fail(
         self,
@@ -553,3 +621,34 @@ class TestCacheDictMapping(SqliteCachingTestBase):
         self.assertEqual(actual.category.id, expected.category_id, actual.msg)
         self.assertEqual(actual.cause.id, expected.id, actual.msg)
         log.info(actual.cause.params)
+
+    def test_mapping_slots(self):
+        mapping = CacheDictMapping(table="aa__bb", key_type=A, value_type=B)
+        self.assertFalse(hasattr(mapping, "__dict__"))
+        with self.assertRaises(AttributeError):
+            mapping.unexpected_attribute = None  # type: ignore
+
+    def test_cached_mapping(self):
+        mapping = CacheDictMapping.cached(table="aa__bb", key_type=A, value_type=B)
+        self.assertIs(
+            mapping,
+            CacheDictMapping.cached(table="aa__bb", key_type=A, value_type=B),
+        )
+        self.assertIsNot(
+            mapping,
+            CacheDictMapping.cached(
+                table="aa__bb",
+                key_type=A,
+                value_type=B,
+                key_types=A(a="TEXT"),
+            ),
+        )
+        self.assertIsNot(
+            mapping,
+            CacheDictMapping.cached(
+                table="aa__bb",
+                key_type=A,
+                value_type=B,
+                pretty=True,
+            ),
+        )
@@ -6,6 +6,7 @@ import parameterized
 
 from sqlitecaching.enums import (
     EnumDuplicateValueException,
+    EnumMemberTypeException,
     EnumNameClashException,
     EnumValueConversionException,
     LevelledEnum,
@@ -226,3 +227,23 @@ class TestSqliteCachingEnums(SqliteCachingTestBase):
         actual = raised_context.exception
         self.assertEqual(actual.category.id, EnumValueConversionException.category_id)
         self.assertEqual(actual.cause.id, EnumValueConversionException.id)
+
+    def test_hashable(self):
+        levels = {TestEnumAB.A: "a", TestEnumAB.B: "b"}
+        self.assertEqual(levels[TestEnumAB.A], "a")
+        self.assertEqual({TestEnumAB.A, TestEnumAB.A, TestEnumAB.B}, set(TestEnumAB))
+
+    def test_bitset(self):
+        a_bit = TestEnumAB.as_bit(TestEnumAB.A)
+        b_bit = TestEnumAB.as_bit(TestEnumAB.B)
+        self.assertNotEqual(a_bit, b_bit)
+        both = TestEnumAB.bitset([TestEnumAB.A, TestEnumAB.B])
+        self.assertEqual(both, a_bit | b_bit)
+        self.assertEqual(TestEnumAB.bitset([TestEnumAB.B]) & a_bit, 0)
+        self.assertEqual(TestEnumAB.bitset([]), 0)
+        with self.assertRaises(TypeError) as raised_context:
+            TestEnumAB.as_bit(TestEnumBA.A)  # type: ignore
+        actual = raised_context.exception
+        self.assertIsInstance(actual, SqliteCachingException)
+        self.assertEqual(actual.category.id, EnumMemberTypeException.category_id)
+        self.assertEqual(actual.cause.id, EnumMemberTypeException.id)
@@ -21,6 +21,7 @@ log = logging.getLogger(__name__)
 class TestSqliteCachingException(SqliteCachingTestBase):
     TEST_CATEGORY = 888
     TEST_DELETED_CATEGORY = 886
+    TEST_REMOVED_CATEGORY = 885
     TEST_MISSING_CATEGORY = 777
 
     TEST_CAUSE = 888
@@ -254,6 +255,51 @@ class TestSqliteCachingException(SqliteCachingTestBase):
             successful_post.msg,
         )
 
+    TestRemovedCategory = SqliteCachingException.register_category(
+        category_name="TestRemovedCategory",
+        category_id=TEST_REMOVED_CATEGORY,
+    )
+    TestRemovedCategoryException = TestRemovedCategory.register_cause(
+        cause_name="TestRemovedCategoryException",
+        cause_id=TEST_CAUSE,
+        fmt="",
+        params=frozenset(
+            [],
+        ),
+    )
+
+    def test_removed_category(self):
+        removed_category = sqlitecaching.exceptions._CATEGORY_REG.pop(
+            CategoryID(self.TEST_REMOVED_CATEGORY),
+        )
+        try:
+            with self.assertRaises(SqliteCachingException) as raised_context:
+                _ = SqliteCachingException(
+                    category_id=self.TEST_REMOVED_CATEGORY,
+                    cause_id=self.TEST_CAUSE,
+                    params={},
+                    stacklevel=1,
+                )
+            actual = raised_context.exception
+            self.assertEqual(
+                actual.cause.id,
+                SqliteCachingMissingCategoryException.id,
+                actual.msg,
+            )
+
+            with self.assertRaises(SqliteCachingException) as raised_context:
+                _ = self.TestRemovedCategoryException({})
+            actual = raised_context.exception
+            self.assertEqual(
+                actual.cause.id,
+                SqliteCachingMissingCategoryException.id,
+                actual.msg,
+            )
+        finally:
+            sqlitecaching.exceptions._CATEGORY_REG[
+                CategoryID(self.TEST_REMOVED_CATEGORY)
+            ] = removed_category
+
     def test_deleted_category(self):
         with self.assertRaises(SqliteCachingException) as raised_context:
             _ = self.TestDeletedCategory.register_cause(
@@ -273,3 +319,19 @@ class TestSqliteCachingException(SqliteCachingTestBase):
             SqliteCachingNoCategoryForCauseException.id,
             actual.msg,
         )
+
+    def test_log_stack_info(self):
+        with self.assertLogs(sqlitecaching.exceptions.log, logging.DEBUG) as logs:
+            _ = self.TestCauseException({})
+        self.assertTrue(logs.records)
+        self.assertTrue(all(r.stack_info is None for r in logs.records))
+
+        with self.assertLogs(sqlitecaching.exceptions.log, logging.DEBUG) as logs:
+            try:
+                SqliteCachingException.log_stack_info(True)
+                _ = self.TestCauseException({})
+            finally:
+                SqliteCachingException.log_stack_info(False)
+        debug_records = [r for r in logs.records if r.levelno == logging.DEBUG]
+        self.assertTrue(debug_records)
+        self.assertTrue(all(r.stack_info for r in debug_records))